@@ -1,66 +1,304 @@
+try:
+    import orjson  # much faster than the json module, used when it's installed
+except ImportError:
+    orjson = None
+import itertools  # Used to filter tasks without a Python loop
 import json  # we use JSON files to keep track of the lists as they are easy to use and easy to handle
-from datetime import datetime  # Used for date validation
+import operator  # Used for fast sort keys
+import os  # Used to check file sizes
+import re  # Used to check the due date format
+import sys  # Used to print a whole list in one go and to read answers
+from datetime import date  # Used for date validation
 
 # creates a file to store tasks
 TASKS_FILE = "tasks.json"
+# every change is added as one line to this file, instead of rewriting the whole tasks file
+JOURNAL_FILE = "tasks.log"
+# tasks.json is saved without indentation to keep it small, this is the easy-to-read copy
+EXPORT_FILE = "tasks_pretty.json"
+
+# Sort order for priorities, most important first
+PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+VALID_PRIORITIES = frozenset(PRIORITY_RANK)
+
+# Today's date, looked up once when the program starts
+TODAY = date.today()
+
+# What a DD-MM-YYYY due date looks like (the day and month may also be a single digit)
+DUE_DATE_PATTERN = re.compile(r"([0-9]{1,2})-([0-9]{1,2})-([0-9]{4})")
+
+# Goes up by one every time tasks.json is rewritten. tasks.json and the first line of the journal both
+# record it, so a journal left over from before the last rewrite is never replayed a second time.
+_generation = 0
+
+# Goes up by one every time the tasks change (see tasks_changed), so we know when cached listings are out of date
+_tasks_version = 0
+# Filtered/sorted listings from list_tasks: filter name -> (_tasks_version when made, tasks)
+_list_cache = {}
 
 
 #                                           Functions:
 
-# Load tasks from file if there is any:
+# Call this whenever a task is added, removed or changed, so list_tasks stops using its cached listings:
+def tasks_changed():
+    global _tasks_version
+    _tasks_version += 1
+
+
+# Asks the user for a line of text (lighter than input() when many answers are piped in):
+def ask(prompt):
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError  # Same as input() when there's nothing left to read
+    return line.strip()
+
+
+# Turns tasks into compact JSON bytes, or indented ones with indent=True (orjson if available, json otherwise):
+def dump_json(data, indent=False):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+# Turns JSON bytes back into tasks:
+def load_json(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Adds the helper fields we keep on each task while the program runs (they start with "_").
+# Call it again whenever the task changes:
+def annotate_task(task):
+    task["_prio_rank"] = PRIORITY_RANK.get(task["priority"], len(PRIORITY_RANK))
+    # Due date as a day number, which sorts correctly (the DD-MM-YYYY text doesn't) and compares quickly
+    due_date_obj = parse_due_date(task["due_date"])
+    task["_due_ord"] = (due_date_obj or date.max).toordinal()  # Put tasks with an unreadable date last
+    # The task's line in listings, so listing doesn't have to format every task each time
+    status = "Done" if task["completed"] else "Pending"
+    task["_line"] = f"- {task['title']} [{task['priority']}] ({task['category']}) Due: {task['due_date']} → {status}"
+
+
+# Returns a copy of the task without the helper fields, for saving:
+def strip_task(task):
+    return {key: value for key, value in task.items() if not key.startswith("_")}
+
+
+# Builds a lookup of tasks by their lowercased title so we don't have to search the whole list.
+# Each title maps to a list of tasks, in list order, since older files may repeat a title in another case:
+def build_index(tasks):
+    index = {}
+    for task in tasks:
+        add_to_index(index, task)
+    return index
+
+
+# Adds a task to the end of its title's entry in the index:
+def add_to_index(index, task):
+    index.setdefault(task["title"].lower(), []).append(task)
+
+
+# Returns the first task with this lowercased title, or None:
+def find_task(index, key):
+    matches = index.get(key)
+    return matches[0] if matches else None
+
+
+# Takes the first task with this lowercased title out of the index, the next one (if any) takes its place:
+def remove_from_index(index, key):
+    matches = index[key]
+    del matches[0]
+    if not matches:
+        del index[key]
+
+
+# Moves a renamed task (the first one under its old title) to its new title in the index.
+# If other tasks already have the new title, that entry is rebuilt so it stays in list order:
+def rename_in_index(tasks, index, key, task):
+    remove_from_index(index, key)
+    new_key = task["title"].lower()
+    if new_key in index:
+        index[new_key] = [other for other in tasks if other["title"].lower() == new_key]
+    else:
+        index[new_key] = [task]
+
+
+# Removes completed tasks from the list and the index, returns how many were removed:
+def drop_completed(tasks, index):
+    initial_count = len(tasks)
+    tasks[:] = itertools.filterfalse(operator.itemgetter("completed"), tasks)  # Keep only uncompleted tasks
+    if len(tasks) < initial_count:
+        index.clear()
+        index.update(build_index(tasks))
+    return initial_count - len(tasks)
+
+
+# Applies one change from the journal to the list of tasks:
+def apply_event(tasks, index, event):
+    tasks_changed()
+    if event["op"] == "add":
+        task = event["task"]
+        annotate_task(task)
+        tasks.append(task)
+        add_to_index(index, task)
+    elif event["op"] == "remove_completed":
+        drop_completed(tasks, index)
+    else:
+        key = event["title"].lower()
+        task = find_task(index, key)
+        if task is None:
+            return
+        if event["op"] == "remove":
+            tasks.remove(task)
+            remove_from_index(index, key)
+        elif event["op"] == "edit":
+            task.update(event["changes"])
+            annotate_task(task)
+            if task["title"].lower() != key:
+                rename_in_index(tasks, index, key, task)
+        elif event["op"] == "complete":
+            task["completed"] = True
+            annotate_task(task)
+
+
+# Load tasks from file if there is any, along with their title index:
 def load_tasks():
+    global _generation
     try:
-        with open(TASKS_FILE, "r") as file:
-            return json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []  # Return an empty list if file doesn't exist or is empty
+        with open(TASKS_FILE, "rb") as file:
+            data = load_json(file.read())
+    except FileNotFoundError:
+        data = []  # Start with an empty list if file doesn't exist
+    except ValueError:  # orjson and json decode errors are both ValueErrors
+        # Keep the unreadable file (and its journal) instead of saving over them, then start empty
+        os.replace(TASKS_FILE, TASKS_FILE + ".bak")
+        if os.path.exists(JOURNAL_FILE):
+            os.replace(JOURNAL_FILE, JOURNAL_FILE + ".bak")
+        print(f"⚠ Could not read '{TASKS_FILE}', it was moved to '{TASKS_FILE}.bak'. Starting with an empty list.")
+        _generation = 0
+        return [], {}
+    if isinstance(data, list):
+        _generation, tasks = 0, data  # Files saved before generations were added are just the list
+    else:
+        _generation, tasks = data["generation"], data["tasks"]
+    for task in tasks:
+        annotate_task(task)
+    index = build_index(tasks)
+
+    # Replays the changes made since the tasks file was last written
+    start_over = False
+    journal_generation = None
+    try:
+        with open(JOURNAL_FILE, "rb") as file:
+            for line in file:
+                try:
+                    event = load_json(line)
+                except ValueError:
+                    start_over = True  # A half-written last line (e.g. the program was killed while saving)
+                    break
+                if journal_generation is None:
+                    # A journal started before tasks.json was first saved has no start line: generation 0
+                    journal_generation = event["generation"] if event["op"] == "start" else 0
+                    if journal_generation != _generation:
+                        start_over = True  # Left over from before tasks.json was rewritten, already in it
+                        break
+                if event["op"] == "start":
+                    continue
+                apply_event(tasks, index, event)
+    except FileNotFoundError:
+        pass
+
+    # Don't let new changes end up after lines that will be skipped on the next load
+    if start_over:
+        save_tasks(tasks)
+    return tasks, index
 
 
-# Saves tasks to the file:
+# Saves all tasks to the file and starts a new, empty journal:
 def save_tasks(tasks):
-    with open(TASKS_FILE, "w") as file:
-        json.dump(tasks, file, indent=4)
+    global _generation
+    _generation += 1
+    data = dump_json({"generation": _generation, "tasks": [strip_task(task) for task in tasks]})
+
+    # Write to a temporary file first and swap it in, so tasks.json is never left half-written
+    temp_file = TASKS_FILE + ".tmp"
+    with open(temp_file, "wb", buffering=0) as file:  # The whole file goes out in a single write
+        file.write(data)
+        os.fsync(file.fileno())
+    os.replace(temp_file, TASKS_FILE)
+
+    with open(JOURNAL_FILE, "wb", buffering=0) as file:
+        file.write(dump_json({"op": "start", "generation": _generation}) + b"\n")
+
+
+# Adds one change to the journal:
+def append_event(tasks, event):
+    line = dump_json(event) + b"\n"
+    with open(JOURNAL_FILE, "ab", buffering=0) as file:
+        file.write(line)
+        journal_size = file.tell()
+
+    # Once the journal gets more than twice as big as the tasks file, it's cheaper to rewrite the tasks file
+    try:
+        tasks_size = os.path.getsize(TASKS_FILE)
+    except FileNotFoundError:
+        tasks_size = 0
+    if journal_size > 2 * tasks_size:
+        save_tasks(tasks)
 
 
 # Function to validate priority inputs:
 def validate_priority(priority):
-    valid_priorities = ["Low", "Medium", "High"]
-    if priority not in valid_priorities:
+    if priority not in VALID_PRIORITIES:
         print("Invalid priority! Must be 'Low', 'Medium', or 'High'. Task creation canceled.")
         return False
     return True
 
 
-# Function to validate due date input in DD-MM-YYYY format:
-def validate_due_date(due_date):
+# Turns a DD-MM-YYYY string into a date (much quicker than datetime.strptime), or None if it isn't valid:
+def parse_due_date(due_date):
+    match = DUE_DATE_PATTERN.fullmatch(due_date)
+    if match is None:
+        return None  # Wrong format, no need to try building a date
+    day, month, year = match.groups()
     try:
-        due_date_obj = datetime.strptime(due_date, "%d-%m-%Y")  # Convert string to date object
-        today = datetime.today()
-
-        if due_date_obj < today:
-            print("⚠ Invalid date! You cannot add a task with a past due date. Task creation canceled.")
-            return False
-        return True
+        return date(int(year), int(month), int(day))
     except ValueError:
+        return None  # Right format but not a real date, like 31-02-2030
+
+
+# Function to validate due date input in DD-MM-YYYY format:
+def validate_due_date(due_date):
+    due_date_obj = parse_due_date(due_date)  # Convert string to date object
+    if due_date_obj is None:
         print("⚠ Invalid date format! Please use DD-MM-YYYY. Task creation canceled.")
         return False
 
+    if due_date_obj < TODAY:
+        print("⚠ Invalid date! You cannot add a task with a past due date. Task creation canceled.")
+        return False
+    return True
+
 
 # Adds a new task:
-def add_task(tasks):
+def add_task(tasks, index):
     """Adds a new task to the to-do list"""
-    title = input("Enter task title: ").strip()
-    category = input("Enter task category (Work, Personal, Shopping, etc.): ").strip()
+    title = ask("Enter task title: ")
+    category = ask("Enter task category (Work, Personal, Shopping, etc.): ")
 
-    priority = input("Enter task priority (High, Medium, Low): ").strip().capitalize()
+    priority = ask("Enter task priority (High, Medium, Low): ").capitalize()
     if not validate_priority(priority):
         return  # Cancel task addition if priority is invalid
 
-    due_date = input("Enter due date (DD-MM-YYYY): ").strip()
+    due_date = ask("Enter due date (DD-MM-YYYY): ")
     if not validate_due_date(due_date):
         return  # Cancel task addition if due date is invalid
 
-    additional_comments = input("Enter any additional comments (or leave blank): ").strip()
+    additional_comments = ask("Enter any additional comments (or leave blank): ")
 
     task = {
         "title": title,
@@ -71,43 +309,50 @@ def add_task(tasks):
         "comments": additional_comments if additional_comments else None  # Store as None if empty
     }
 
+    annotate_task(task)
     tasks.append(task)
-    save_tasks(tasks)
+    add_to_index(index, task)
+    tasks_changed()
+    append_event(tasks, {"op": "add", "task": strip_task(task)})
     print(f"Task '{title}' added successfully!")
 
 
 
 # Removes a task:
-def remove_task(tasks):
+def remove_task(tasks, index):
     """Removes a task by title"""
-    title = input("Enter task title to remove: ").strip()
-    for task in tasks:
-        if task["title"].lower() == title.lower():
-            tasks.remove(task)
-            save_tasks(tasks)
-            print(f"Task '{title}' removed successfully!")
-            return
-    print("⚠ Task not found!")
+    title = ask("Enter task title to remove: ")
+    key = title.lower()
+    task = find_task(index, key)
+    if task is None:
+        print("⚠ Task not found!")
+        return
+    tasks.remove(task)
+    remove_from_index(index, key)
+    tasks_changed()
+    append_event(tasks, {"op": "remove", "title": title})
+    print(f"Task '{title}' removed successfully!")
 
 
 # Removes all completed tasks:
-def remove_completed_tasks(tasks):
+def remove_completed_tasks(tasks, index):
     """Removes all completed tasks"""
-    initial_count = len(tasks)
-    tasks[:] = [task for task in tasks if not task["completed"]]  # Keep only uncompleted tasks
-    if len(tasks) < initial_count:
-        save_tasks(tasks)
+    if drop_completed(tasks, index):
+        tasks_changed()
+        append_event(tasks, {"op": "remove_completed"})
         print("All completed tasks removed successfully!")
     else:
         print("⚠ No completed tasks to remove!")
 
 
 # Removes all tasks:
-def remove_all_tasks(tasks):
+def remove_all_tasks(tasks, index):
     # We are asking reminding if user is sure
-    confirm = input("Are you sure you want to remove all tasks? (yes/no): ").strip().lower()
+    confirm = ask("Are you sure you want to remove all tasks? (yes/no): ").lower()
     if confirm == "yes":
         tasks.clear()
+        index.clear()
+        tasks_changed()
         save_tasks(tasks)
         print(" All tasks removed successfully!")
     # If no, then it'll cancel, if yes it will remove
@@ -116,60 +361,86 @@ def remove_all_tasks(tasks):
 
 
 # Edits a task:
-def edit_task(tasks):
+def edit_task(tasks, index):
     """Edits an existing task"""
-    title = input("Enter task title to edit: ").strip()
-    for task in tasks:
-        if task["title"].lower() == title.lower():
-            print("Leave blank to keep current value.")
-
-            new_title = input(f"New title ({task['title']}): ").strip() or task["title"]
-            new_category = input(f"New category ({task['category']}): ").strip() or task["category"]
-
-            new_priority = input(f"New priority ({task['priority']}): ").strip().capitalize() or task["priority"]
-            if new_priority and not validate_priority(new_priority):
-                return  # Cancel update if new priority is invalid
-
-            new_due_date = input(f"New due date ({task['due_date']}): ").strip() or task["due_date"]
-            if new_due_date and not validate_due_date(new_due_date):
-                return  # Cancel update if new date is invalid
-
-            # Ask to edit or add a comment
-            if task["comments"]:
-                print(f"Current comments: {task['comments']}")
-            else:
-                print("No additional comments currently.")
-
-            new_comments = input("Enter updated comments (leave blank to keep existing ones): ").strip()
-            task["comments"] = new_comments if new_comments else task[
-                "comments"]  # Keep existing comments if left blank
-
-            task.update({
-                "title": new_title,
-                "category": new_category,
-                "priority": new_priority,
-                "due_date": new_due_date,
-                "comments": task["comments"]
-            })
-
-            save_tasks(tasks)
-            print(f"✏ Task '{new_title}' updated successfully!")
-            return
+    title = ask("Enter task title to edit: ")
+    key = title.lower()  # Lowercase the title once and reuse it
+    task = find_task(index, key)
+    if task is None:
+        print("⚠ Task not found!")
+        return
+
+    print("Leave blank to keep current value.")
+
+    new_title = ask(f"New title ({task['title']}): ") or task["title"]
+    new_category = ask(f"New category ({task['category']}): ") or task["category"]
 
-    print("⚠ Task not found!")
+    new_priority = ask(f"New priority ({task['priority']}): ").capitalize() or task["priority"]
+    if new_priority and not validate_priority(new_priority):
+        return  # Cancel update if new priority is invalid
+
+    new_due_date = ask(f"New due date ({task['due_date']}): ") or task["due_date"]
+    if new_due_date and not validate_due_date(new_due_date):
+        return  # Cancel update if new date is invalid
+
+    # Ask to edit or add a comment
+    if task["comments"]:
+        print(f"Current comments: {task['comments']}")
+    else:
+        print("No additional comments currently.")
+
+    new_comments = ask("Enter updated comments (leave blank to keep existing ones): ")
+    task["comments"] = new_comments if new_comments else task[
+        "comments"]  # Keep existing comments if left blank
+
+    changes = {
+        "title": new_title,
+        "category": new_category,
+        "priority": new_priority,
+        "due_date": new_due_date,
+        "comments": task["comments"]
+    }
+    task.update(changes)
+    annotate_task(task)
+    if new_title.lower() != key:
+        rename_in_index(tasks, index, key, task)
+    tasks_changed()
+
+    append_event(tasks, {"op": "edit", "title": title, "changes": changes})
+    print(f"✏ Task '{new_title}' updated successfully!")
 
 
 # Marks a task as complete:
-def mark_task_complete(tasks):
+def mark_task_complete(tasks, index):
     """Marks a task as completed"""
-    title = input("Enter task title to mark as complete: ").strip()
-    for task in tasks:
-        if task["title"].lower() == title.lower():
-            task["completed"] = True
-            save_tasks(tasks)
-            print(f"Task '{title}' marked as complete!")
-            return
-    print("Task not found!")
+    title = ask("Enter task title to mark as complete: ")
+    task = find_task(index, title.lower())
+    if task is None:
+        print("Task not found!")
+        return
+    task["completed"] = True
+    annotate_task(task)
+    tasks_changed()
+    append_event(tasks, {"op": "complete", "title": title})
+    print(f"Task '{title}' marked as complete!")
+
+
+# Prints a heading and the tasks below it, building the text first so it's written all at once:
+def print_task_list(heading, tasks):
+    lines = [heading]
+    lines.extend(map(operator.itemgetter("_line"), tasks))  # Lines were already formatted by annotate_task
+    lines.append("\n")  # Blank line after the list
+    sys.stdout.write("\n".join(lines))
+
+
+# The filters and sorts list_tasks can apply, set up once when the program starts.
+# filter/filterfalse with itemgetter check each task in C instead of a Python loop.
+LIST_FILTERS = {
+    "incomplete": lambda tasks, key=operator.itemgetter("completed"): list(itertools.filterfalse(key, tasks)),
+    "complete": lambda tasks, key=operator.itemgetter("completed"): list(filter(key, tasks)),
+    "priority": lambda tasks, key=operator.itemgetter("_prio_rank"): sorted(tasks, key=key),
+    "due_date": lambda tasks, key=operator.itemgetter("_due_ord"): sorted(tasks, key=key),
+}
 
 
 # Lists all tasks:
@@ -179,20 +450,16 @@ def list_tasks(tasks, filter_by=None):
         print("No tasks found!")
         return
 
-    if filter_by == "incomplete":
-        tasks = [task for task in tasks if not task["completed"]]
-    elif filter_by == "complete":
-        tasks = [task for task in tasks if task["completed"]]
-    elif filter_by == "priority":
-        tasks = sorted(tasks, key=lambda t: t["priority"], reverse=True)
-    elif filter_by == "due_date":
-        tasks = sorted(tasks, key=lambda t: t["due_date"])
+    if filter_by:
+        # Reuse the last result for this filter if no task has changed since
+        version, cached_tasks = _list_cache.get(filter_by, (None, None))
+        if version == _tasks_version:
+            tasks = cached_tasks
+        else:
+            tasks = LIST_FILTERS[filter_by](tasks)
+            _list_cache[filter_by] = (_tasks_version, tasks)
 
-    print("\n📋 TO-DO LIST 📋")
-    for task in tasks:
-        status = "Done" if task["completed"] else "Pending"
-        print(f"- {task['title']} [{task['priority']}] ({task['category']}) Due: {task['due_date']} → {status}")
-    print()
+    print_task_list("\n📋 TO-DO LIST 📋", tasks)
 
 
 # Sorts tasks by category:
@@ -203,81 +470,89 @@ def sort_tasks_by_category(tasks):
         return
 
     sorted_tasks = sorted(tasks, key=lambda t: t["category"].lower())  # Sort by category (case-insensitive)
-    print("\n📋 TO-DO LIST (Sorted by Category) 📋")
-    for task in sorted_tasks:
-        status = "Done" if task["completed"] else "Pending"
-        print(f"- {task['title']} [{task['priority']}] ({task['category']}) Due: {task['due_date']} → {status}")
-    print()
+    print_task_list("\n📋 TO-DO LIST (Sorted by Category) 📋", sorted_tasks)
+
+# Writes an indented copy of the tasks that's easy to read:
+def export_tasks(tasks):
+    """Exports all tasks to a human-readable JSON file"""
+    data = dump_json([strip_task(task) for task in tasks], indent=True)
+    with open(EXPORT_FILE, "wb", buffering=0) as file:
+        file.write(data)
+    print(f"Tasks exported to '{EXPORT_FILE}'!")
+
 
 # View additional comments for a task
-def view_task_comments(tasks):
+def view_task_comments(index):
     """Displays the additional comments for a task if they exist"""
-    title = input("Enter the task title to view additional comments: ").strip()
-    for task in tasks:
-        if task["title"].lower() == title.lower():
-            if task["comments"]:
-                print(f"\n📌 Additional comments for '{task['title']}':")
-                print(task["comments"])
-            else:
-                print(f"⚠ No additional comments for '{task['title']}'.")
-            return
-    print("⚠ Task not found!")
+    title = ask("Enter the task title to view additional comments: ")
+    task = find_task(index, title.lower())
+    if task is None:
+        print("⚠ Task not found!")
+        return
+    if task["comments"]:
+        print(f"\n📌 Additional comments for '{task['title']}':")
+        print(task["comments"])
+    else:
+        print(f"⚠ No additional comments for '{task['title']}'.")
 
 
 #                                              Main Menu:
+# The menu text is built once instead of being printed line by line every time
+MENU = "\n".join([
+    "\n📌 SMART TO-DO LIST MENU 📌",
+    "1. Add Task",
+    "2. Remove Task",
+    "3. Remove All Tasks",
+    "4. Edit Task",
+    "5. Mark Task as Complete",
+    "6. List All Tasks",
+    "7. List Pending Tasks",
+    "8. List Completed Tasks",
+    "9. Sort by Priority",
+    "10. Sort by Due Date",
+    "11. Remove All Completed Tasks",
+    "12. Sort by Category",
+    "13. View Additional Comments for a Task",
+    "14. Export Tasks as Readable JSON",
+    "0. Exit",
+])
+
+# Which function runs for each menu option (all of them are called with tasks and index)
+DISPATCH = {
+    "1": add_task,
+    "2": remove_task,
+    "3": remove_all_tasks,
+    "4": edit_task,
+    "5": mark_task_complete,
+    "6": lambda tasks, index: list_tasks(tasks),
+    "7": lambda tasks, index: list_tasks(tasks, filter_by="incomplete"),
+    "8": lambda tasks, index: list_tasks(tasks, filter_by="complete"),
+    "9": lambda tasks, index: list_tasks(tasks, filter_by="priority"),
+    "10": lambda tasks, index: list_tasks(tasks, filter_by="due_date"),
+    "11": remove_completed_tasks,
+    "12": lambda tasks, index: sort_tasks_by_category(tasks),
+    "13": lambda tasks, index: view_task_comments(index),
+    "14": lambda tasks, index: export_tasks(tasks),
+}
+
+
 def main():
-    tasks = load_tasks()
+    tasks, index = load_tasks()
 
     while True:
-        print("\n📌 SMART TO-DO LIST MENU 📌")
-        print("1. Add Task")
-        print("2. Remove Task")
-        print("3. Remove All Tasks")
-        print("4. Edit Task")
-        print("5. Mark Task as Complete")
-        print("6. List All Tasks")
-        print("7. List Pending Tasks")
-        print("8. List Completed Tasks")
-        print("9. Sort by Priority")
-        print("10. Sort by Due Date")
-        print("11. Remove All Completed Tasks")
-        print("12. Sort by Category")
-        print("13. View Additional Comments for a Task")
-        print("0. Exit")
-
-        choice = input("Select an option (0-13): ").strip()
-
-        if choice == "1":
-            add_task(tasks)
-        elif choice == "2":
-            remove_task(tasks)
-        elif choice == "3":
-            remove_all_tasks(tasks)
-        elif choice == "4":
-            edit_task(tasks)
-        elif choice == "5":
-            mark_task_complete(tasks)
-        elif choice == "6":
-            list_tasks(tasks)
-        elif choice == "7":
-            list_tasks(tasks, filter_by="incomplete")
-        elif choice == "8":
-            list_tasks(tasks, filter_by="complete")
-        elif choice == "9":
-            list_tasks(tasks, filter_by="priority")
-        elif choice == "10":
-            list_tasks(tasks, filter_by="due_date")
-        elif choice == "11":
-            remove_completed_tasks(tasks)
-        elif choice == "12":
-            sort_tasks_by_category(tasks)
-        elif choice == "13":
-            view_task_comments(tasks)
-        elif choice == "0":
+        print(MENU)
+
+        choice = ask("Select an option (0-14): ")
+
+        if choice == "0":
             print("See you next time!")
             break
-        else:
+
+        handler = DISPATCH.get(choice)
+        if handler is None:
             print("⚠ Invalid choice, please try again.")
+            continue
+        handler(tasks, index)
 
 
 # Run the to-do list application